@@ -0,0 +1,48 @@
+"""Parameterised twint scraper driver.
+
+Replaces the copy-pasted per-housemate scripts (laycon.py, dorathy.py,
+ozo.py, trickytee.py), which differed only in search term. Passing all
+the housemates to one invocation pays interpreter startup and the twint
+import once instead of once per housemate:
+
+    python run.py --query laycon dorathy ozo --since 2020-09-18 --until 2020-09-18
+"""
+
+import argparse
+import sys
+
+
+def scrape(query: str, since: str, until: str, output: str) -> None:
+    import twint
+
+    c = twint.Config()
+    c.Search = query
+    c.Since = f'{since} 00:00:00'
+    c.Until = f'{until} 23:59:59'
+    c.Store_csv = True
+    c.Output = output
+    twint.run.Search(c)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--query', nargs='+', required=True,
+                        help='one search term per housemate')
+    parser.add_argument('--since', required=True, help='start date YYYY-MM-DD')
+    parser.add_argument('--until', required=True, help='end date YYYY-MM-DD')
+    parser.add_argument('--output-dir', default='Scraped_tweets')
+    args = parser.parse_args()
+
+    if 'ipykernel' in sys.modules:
+        # Only Jupyter already runs an event loop; everywhere else the
+        # stock asyncio loop is faster than nest_asyncio's patched one.
+        import nest_asyncio
+        nest_asyncio.apply()
+
+    for query in args.query:
+        scrape(query, args.since, args.until,
+               f'{args.output_dir}/{query}.csv')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""Scrape tweets for every housemate in one async batch.
+
+Replaces running the per-housemate twint scripts back to back: all search
+queries share one event loop and one HTTP session, so the network round
+trips overlap instead of serialising. Concurrency is capped at 5 to stay
+friendly with rate limits.
+
+Needs a Twitter API v2 bearer token in the TWITTER_BEARER_TOKEN
+environment variable.
+
+Usage:
+    python scrape_all.py --since 2020-09-18 --until 2020-09-19
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import sys
+
+import aiohttp
+
+SEARCH_URL = 'https://api.twitter.com/2/tweets/search/recent'
+
+HOUSEMATES = ['laycon', 'dorathy', 'ozo', 'trickytee', 'kiddwaya']
+
+MAX_CONCURRENCY = 5
+PAGE_SIZE = 100
+OUTPUT_DIR = 'Scraped_tweets'
+
+
+async def fetch(session, query, since, until):
+    """Fetch all pages of tweets for one query, returning rows of
+    (date, tweet, urls)."""
+    rows = []
+    params = {
+        'query': query,
+        'start_time': f'{since}T00:00:00Z',
+        'end_time': f'{until}T23:59:59Z',
+        'max_results': PAGE_SIZE,
+        'tweet.fields': 'created_at,entities',
+    }
+    while True:
+        async with session.get(SEARCH_URL, params=params) as resp:
+            resp.raise_for_status()
+            payload = await resp.json()
+
+        for tweet in payload.get('data', []):
+            urls = [u.get('expanded_url', '')
+                    for u in tweet.get('entities', {}).get('urls', [])]
+            rows.append((tweet.get('created_at', ''), tweet.get('text', ''),
+                         str(urls)))
+
+        next_token = payload.get('meta', {}).get('next_token')
+        if not next_token:
+            break
+        params['next_token'] = next_token
+
+    print(f'{query}: {len(rows)} tweets')
+    return query, rows
+
+
+def write_rows(query, rows):
+    filepath = os.path.join(OUTPUT_DIR, f'{query}.csv')
+    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['date', 'tweet', 'urls'])
+        writer.writerows(rows)
+
+
+async def scrape_all(queries, since, until, token):
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY)
+    headers = {'Authorization': f'Bearer {token}'}
+    async with aiohttp.ClientSession(connector=connector,
+                                     headers=headers) as session:
+        results = await asyncio.gather(
+            *[fetch(session, query, since, until) for query in queries])
+    for query, rows in results:
+        write_rows(query, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--since', required=True, help='start date YYYY-MM-DD')
+    parser.add_argument('--until', required=True, help='end date YYYY-MM-DD')
+    parser.add_argument('--queries', nargs='*', default=HOUSEMATES,
+                        help='search terms, one per housemate')
+    args = parser.parse_args()
+
+    token = os.environ.get('TWITTER_BEARER_TOKEN')
+    if not token:
+        sys.exit('TWITTER_BEARER_TOKEN is not set')
+
+    asyncio.run(scrape_all(args.queries, args.since, args.until, token))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Container for per-housemate rating results."""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class AnalysisResult:
+    """Per-housemate ratings as a single structure-of-arrays frame.
+
+    One DataFrame indexed by housemate name replaces the three parallel
+    dicts this class used to carry: extrema and sorting become C-level
+    reductions over contiguous float columns, and consumers can take
+    whole columns instead of walking dicts key by key. The dict-shaped
+    accessors remain as properties for existing callers.
+    """
+
+    _COLUMNS = ['rating', 'raw_score', 'tweet_count']
+
+    def __init__(self):
+        self._df = pd.DataFrame(columns=self._COLUMNS)
+        self._order = None
+
+    def _rating_order(self) -> np.ndarray:
+        """Ascending argsort of the rating column.
+
+        Computed lazily and kept until the next insert, so the sorted
+        listing and both extrema share one sort instead of each accessor
+        re-scanning the column.
+        """
+        if self._order is None:
+            self._order = np.argsort(self._df['rating'].to_numpy())
+        return self._order
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        return self._df
+
+    @property
+    def housemate_ratings(self) -> Dict[str, float]:
+        return self._df['rating'].to_dict()
+
+    @property
+    def raw_scores(self) -> Dict[str, float]:
+        return self._df['raw_score'].to_dict()
+
+    @property
+    def total_tweets(self) -> Dict[str, int]:
+        return {name: int(count)
+                for name, count in self._df['tweet_count'].items()}
+
+    # Structure-of-arrays accessors: consumers that iterate every
+    # housemate (the summary printer, the charts) take these instead of
+    # the dict properties, so reductions and sorts run over contiguous
+    # columns rather than per-key hash lookups.
+
+    @property
+    def housemates(self) -> List[str]:
+        return list(self._df.index)
+
+    @property
+    def ratings_arr(self) -> np.ndarray:
+        return self._df['rating'].to_numpy()
+
+    @property
+    def raw_scores_arr(self) -> np.ndarray:
+        return self._df['raw_score'].to_numpy()
+
+    @property
+    def tweet_counts_arr(self) -> np.ndarray:
+        return self._df['tweet_count'].to_numpy()
+
+    def add_housemate_result(self, name: str, rating: float,
+                             raw_score: float, tweet_count: int) -> None:
+        self._df.loc[name] = [rating, raw_score, tweet_count]
+        self._order = None
+
+    def bulk_add(self, names: List[str], ratings: List[float],
+                 raw_scores: List[float], tweet_counts: List[int]) -> None:
+        """Append a whole batch of housemates in one frame build.
+
+        Per-name .loc inserts reallocate the frame on every call; one
+        concat of a frame built from the parallel lists does the work
+        once, which matters as casts grow past a handful of housemates.
+        """
+        new = pd.DataFrame(
+            {'rating': ratings, 'raw_score': raw_scores,
+             'tweet_count': tweet_counts},
+            index=list(names))
+        self._df = new if self._df.empty else pd.concat([self._df, new])
+        self._order = None
+
+    def get_sorted_ratings(self) -> List[Tuple[str, float]]:
+        names = self._df.index
+        ratings = self._df['rating'].to_numpy()
+        return [(names[i], float(ratings[i]))
+                for i in self._rating_order()[::-1]]
+
+    def get_highest_rated(self) -> Tuple[str, float]:
+        i = self._rating_order()[-1]
+        return self._df.index[i], float(self._df['rating'].iloc[i])
+
+    def get_lowest_rated(self) -> Tuple[str, float]:
+        i = self._rating_order()[0]
+        return self._df.index[i], float(self._df['rating'].iloc[i])
@@ -0,0 +1,72 @@
+"""Shared configuration for the analysis pipeline."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar, FrozenSet, Tuple
+
+PIE_CHART_FILENAME = 'bbnaija_pie.png'
+BAR_CHART_FILENAME = 'bbnaija_bar.png'
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Paths and constants used across the loading/analysis modules.
+
+    Frozen with slots: the hot paths read these attributes constantly,
+    and slot access is a fixed offset instead of a __dict__ hash lookup.
+    The chart paths are joined once up front rather than per call.
+    """
+
+    REQUIRED_COLUMNS: ClassVar[Tuple[str, ...]] = ('date', 'tweet', 'urls')
+    REQUIRED_COLUMNS_SET: ClassVar[FrozenSet[str]] = frozenset(
+        REQUIRED_COLUMNS)
+    TWITTER_DOMAIN: ClassVar[str] = 'twitter.com'
+    # Files past the threshold are streamed and cleaned chunk by chunk
+    # instead of loaded whole.
+    STREAM_CHUNK_ROWS: ClassVar[int] = 50_000
+    STREAM_THRESHOLD_BYTES: ClassVar[int] = 64 * 1024 * 1024
+    # Agg raster cost grows quadratically with DPI, and the charts are
+    # consumed on screen; default to screen resolution and keep the old
+    # print-quality setting around for publication renders.
+    CHART_DPI: ClassVar[int] = 100
+    CHART_HIRES_DPI: ClassVar[int] = 500
+    CHART_TITLE: ClassVar[str] = 'Viewers tweet rating for this week'
+    # Collect after each chart batch; matplotlib figures sit in reference
+    # cycles that otherwise linger until a full GC happens to run.
+    FORCE_GC: ClassVar[bool] = True
+
+    data_path: Path = Path('Scraped_tweets')
+    output_path: Path = Path('Scraped_tweets')
+    pie_chart_path: Path = None
+    bar_chart_path: Path = None
+    # Render charts inline instead of in the background render process;
+    # slower, but simpler to debug.
+    single_process_charts: bool = False
+    _paths_validated: bool = False
+
+    def __post_init__(self):
+        # frozen=True blocks normal assignment, hence object.__setattr__.
+        object.__setattr__(self, 'data_path', Path(self.data_path))
+        object.__setattr__(self, 'output_path', Path(self.output_path))
+        object.__setattr__(self, 'pie_chart_path',
+                           self.output_path / PIE_CHART_FILENAME)
+        object.__setattr__(self, 'bar_chart_path',
+                           self.output_path / BAR_CHART_FILENAME)
+
+    def get_pie_chart_path(self) -> Path:
+        return self.pie_chart_path
+
+    def get_bar_chart_path(self) -> Path:
+        return self.bar_chart_path
+
+    def validate_paths(self) -> None:
+        # Validation touches the filesystem (is_dir + mkdir); once it has
+        # passed for this config it can't start failing, so don't repeat
+        # the syscalls on every run_analysis call.
+        if self._paths_validated:
+            return
+        if not self.data_path.is_dir():
+            raise FileNotFoundError(
+                f'Data directory not found: {self.data_path}')
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        object.__setattr__(self, '_paths_validated', True)
@@ -0,0 +1,87 @@
+"""End-to-end pipeline: load, clean, score and rate every housemate."""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+import pandas as pd
+
+from analysis_result import AnalysisResult
+from config import Config
+from data_cleaner import TweetDataCleaner
+from data_loader import TweetData, TweetDataLoader
+from rating_calculator import RatingCalculator
+from sentiment_analyzer import SentimentAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+def _analyze_one(args: Tuple[str, pd.DataFrame]) -> Tuple[str, float, int]:
+    """Score one housemate's cleaned tweets.
+
+    Top-level so it pickles into worker processes; each worker builds its
+    own VADER instance rather than shipping one across the boundary.
+    """
+    housemate_name, df = args
+    analyzer = SentimentAnalyzer()
+    # analyze_dataframe returns just the score columns; nothing here needs
+    # them joined back onto the tweets.
+    scores = analyzer.analyze_dataframe(df)
+    return housemate_name, float(scores['compound'].mean()), len(scores)
+
+
+class BBNaijaAnalysisCoordinator:
+    """Runs the whole analysis and hands back the rating table."""
+
+    def __init__(self, config: Config = None):
+        self.config = config or Config()
+        self.loader = TweetDataLoader(self.config)
+        self.cleaner = TweetDataCleaner(self.config)
+        self.calculator = RatingCalculator()
+
+    def _analyze_sentiment(
+            self, cleaned: List[TweetData]) -> List[Tuple[str, float, int]]:
+        """VADER scoring is CPU-bound pure Python, so housemates are
+        scored in separate processes instead of serially under one GIL."""
+        jobs = [(td.housemate_name, td.dataframe) for td in cleaned]
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_analyze_one, jobs))
+        for name, mean, count in results:
+            logger.info('Analyzed sentiment for %s: mean compound '
+                        '%.4f over %d tweets', name, mean, count)
+        return results
+
+    def _load_and_clean(self) -> List[TweetData]:
+        """Load and clean every housemate CSV.
+
+        Small files go through the batch load + parallel clean path;
+        files past Config.STREAM_THRESHOLD_BYTES are streamed in chunks
+        with cleaning folded into the read, so a season's worth of
+        scraped tweets never has to fit in memory at once.
+        """
+        csv_files = self.loader.file_utils.find_csv_files(
+            self.config.data_path)
+        small, large = [], []
+        for filename, name in csv_files:
+            size = os.path.getsize(
+                f'{self.loader.data_path_str}/{filename}')
+            (large if size >= self.config.STREAM_THRESHOLD_BYTES
+             else small).append((filename, name))
+
+        cleaned = self.cleaner.clean_all_tweet_data(
+            self.loader.load_files(small))
+        cleaned += [self.loader.load_and_clean_streaming(filename, name,
+                                                         self.cleaner)
+                    for filename, name in large]
+        cleaned.sort(key=lambda td: td.housemate_name)
+        return cleaned
+
+    def run_analysis(self) -> Tuple[AnalysisResult, pd.DataFrame]:
+        self.config.validate_paths()
+        cleaned = self._load_and_clean()
+        if not cleaned:
+            raise RuntimeError(
+                f'No tweet CSVs found in {self.config.data_path}')
+        sentiment_results = self._analyze_sentiment(cleaned)
+        return self.calculator.calculate_all_ratings(sentiment_results)
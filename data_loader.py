@@ -0,0 +1,131 @@
+"""Loading of scraped tweet CSVs into per-housemate frames."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Tuple
+
+import pandas as pd
+
+from config import Config
+from file_utils import FileUtils
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = 'string'
+
+
+class TweetData:
+    """One housemate's scraped tweets."""
+
+    def __init__(self, housemate_name: str, dataframe: pd.DataFrame):
+        self.housemate_name = housemate_name
+        self.dataframe = dataframe
+
+
+class TweetDataLoader:
+    """Reads every scraped CSV under the configured data directory."""
+
+    def __init__(self, config: Config = None):
+        self.config = config or Config()
+        self.file_utils = FileUtils()
+        # PurePath division re-resolves the path flavour on every join;
+        # per-file paths are built from this cached string instead.
+        self.data_path_str = str(self.config.data_path)
+
+    def _load_single_file(self, filename: str,
+                          housemate_name: str) -> TweetData:
+        """Read one scraped CSV, parsing only what the pipeline uses.
+
+        twint emits 30-odd metadata columns per tweet; usecols makes the
+        tokenizer skip everything but date/tweet/urls, and the explicit
+        string dtypes spare pandas the per-column type inference. A file
+        without the required columns fails the read outright.
+        """
+        # No exists/is_file/access pre-flight: read_csv opens the file
+        # anyway and raises precisely, and load_all_tweets already logs
+        # and skips per-file failures. LBYL here just tripled the
+        # syscalls per file.
+        file_path = f'{self.data_path_str}/{filename}'
+        read_kwargs = dict(
+            usecols=self.config.REQUIRED_COLUMNS,
+            # Arrow-backed strings sit in contiguous buffers (~no per-cell
+            # Python object overhead) and keep the .str kernels vectorized;
+            # plain 'string' is the degraded form when pyarrow is absent.
+            # The cleaning path only ever asks date.notna(), so the date
+            # column stays a string: datetime parsing is one of the most
+            # expensive per-cell steps in read_csv, and whoever needs real
+            # timestamps can run one pd.to_datetime downstream.
+            dtype={'date': _STRING_DTYPE, 'tweet': _STRING_DTYPE,
+                   'urls': _STRING_DTYPE},
+        )
+        try:
+            # Arrow's reader parses chunks of the file in parallel and
+            # keeps strings in Arrow buffers rather than boxing every
+            # cell into its own Python str.
+            df = pd.read_csv(file_path, engine='pyarrow',
+                             dtype_backend='pyarrow', **read_kwargs)
+        except (ImportError, ValueError) as exc:
+            # ImportError: pyarrow not installed. ValueError: an older
+            # pandas rejecting one of the options under engine='pyarrow'.
+            logger.debug('pyarrow CSV engine unavailable for %s (%s); '
+                         'using the default parser', filename, exc)
+            df = pd.read_csv(file_path, on_bad_lines='skip', **read_kwargs)
+        return TweetData(housemate_name, df)
+
+    def load_and_clean_streaming(self, filename: str, housemate_name: str,
+                                 cleaner) -> TweetData:
+        """Stream one large CSV in chunks, cleaning as it goes.
+
+        Cleaning discards most columns and many rows, so folding it into
+        the read keeps peak memory at O(chunk) instead of O(file). Only
+        the default engine supports chunked reads, hence no pyarrow here.
+        """
+        file_path = f'{self.data_path_str}/{filename}'
+        cleaned_chunks = []
+        reader = pd.read_csv(
+            file_path, on_bad_lines='skip',
+            chunksize=self.config.STREAM_CHUNK_ROWS,
+            usecols=self.config.REQUIRED_COLUMNS,
+            dtype={'date': _STRING_DTYPE, 'tweet': _STRING_DTYPE,
+                   'urls': _STRING_DTYPE})
+        for chunk in reader:
+            cleaned = cleaner.clean_tweet_data(
+                TweetData(housemate_name, chunk))
+            cleaned_chunks.append(cleaned.dataframe)
+        df = pd.concat(cleaned_chunks, ignore_index=True)
+        logger.info('Streamed %s: %d tweets kept', filename, len(df))
+        return TweetData(housemate_name, df)
+
+    def load_files(self,
+                   csv_files: List[Tuple[str, str]]) -> List[TweetData]:
+        tweet_data_list: List[TweetData] = []
+        if not csv_files:
+            return tweet_data_list
+        # Each file is an independent read: threads overlap the disk I/O
+        # across files, and the Arrow parser releases the GIL while it
+        # tokenizes, so parsing overlaps too.
+        with ThreadPoolExecutor(
+                max_workers=min(8, len(csv_files))) as executor:
+            futures = {
+                executor.submit(self._load_single_file, filename, name):
+                    filename
+                for filename, name in csv_files}
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    tweet_data_list.append(future.result())
+                    logger.info('Loaded %s', filename)
+                except Exception as exc:
+                    logger.error('Failed to load %s: %s', filename, exc)
+        # as_completed hands results back in finish order; keep output
+        # deterministic for everything downstream.
+        tweet_data_list.sort(key=lambda td: td.housemate_name)
+        return tweet_data_list
+
+    def load_all_tweets(self) -> List[TweetData]:
+        return self.load_files(
+            self.file_utils.find_csv_files(self.config.data_path))
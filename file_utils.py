@@ -0,0 +1,43 @@
+"""Filesystem helpers for locating and checking scraped-data files."""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Tuple
+
+
+@lru_cache(maxsize=32)
+def _scan_csv_files(directory: str, mtime_ns: int) -> Tuple[Tuple[str, str],
+                                                            ...]:
+    """Scan ``directory`` for CSVs; keyed on its mtime so repeat calls in
+    the same session (notebooks, repeated run_analysis) skip the scan
+    until the directory actually changes."""
+    csv_files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith('.csv'):
+                # Slice the known 4-char suffix instead of a Path
+                # round-trip per entry.
+                csv_files.append((entry.name, entry.name[:-4]))
+    return tuple(sorted(csv_files))
+
+
+class FileUtils:
+    """Small static helpers shared by the loaders."""
+
+    @staticmethod
+    def get_filename_without_extension(filename: str) -> str:
+        return Path(filename).stem
+
+    @staticmethod
+    def find_csv_files(directory) -> List[Tuple[str, str]]:
+        """Return (filename, housemate_name) pairs for every CSV in
+        ``directory``, sorted by filename.
+
+        scandir's DirEntry carries the file type from the directory read
+        itself, so no entry needs a separate stat the way the old
+        listdir + Path.is_file chain did.
+        """
+        directory = str(directory)
+        return list(_scan_csv_files(directory,
+                                    os.stat(directory).st_mtime_ns))
@@ -0,0 +1,62 @@
+"""Turns per-housemate sentiment scores into normalised ratings."""
+
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analysis_result import AnalysisResult
+
+logger = logging.getLogger(__name__)
+
+
+class RatingCalculator:
+    """Normalises mean compound scores into percentage ratings."""
+
+    def calculate_all_ratings(
+            self, sentiment_results: List[Tuple[str, float, int]]
+    ) -> Tuple[AnalysisResult, pd.DataFrame]:
+        """Build the rating table from (name, mean_compound, tweet_count)
+        tuples gathered by the coordinator."""
+        raw_ratings = {name: mean for name, mean, _ in sentiment_results}
+        tweet_counts = {name: count for name, _, count in sentiment_results}
+        normalized = self._normalize_to_percentages(raw_ratings)
+
+        result = AnalysisResult()
+        names = list(normalized)
+        result.bulk_add(names,
+                        [normalized[name] for name in names],
+                        [raw_ratings[name] for name in names],
+                        [tweet_counts[name] for name in names])
+        df = self._create_results_dataframe(normalized, raw_ratings,
+                                            tweet_counts)
+        return result, df
+
+    def _normalize_to_percentages(
+            self, raw_ratings: Dict[str, float]) -> Dict[str, float]:
+        # The arithmetic runs in one NumPy divide rather than a Python
+        # dict comprehension — irrelevant for 5 housemates, but keeps the
+        # path flat for bigger casts.
+        names = list(raw_ratings)
+        vals = np.fromiter(raw_ratings.values(), dtype=np.float64,
+                           count=len(raw_ratings))
+        total = vals.sum()
+        if total:
+            pct = vals / total * 100.0
+        else:
+            pct = np.full_like(vals, 100.0 / len(vals))
+        return dict(zip(names, pct.tolist()))
+
+    def _create_results_dataframe(self, normalized_ratings: Dict[str, float],
+                                  raw_ratings: Dict[str, float],
+                                  tweet_counts: Dict[str, int]
+                                  ) -> pd.DataFrame:
+        # One pass over the result set instead of four key-iterations
+        # building separate column lists.
+        records = [(name, normalized_ratings[name], raw_ratings[name],
+                    tweet_counts[name]) for name in normalized_ratings]
+        df = pd.DataFrame.from_records(
+            records,
+            columns=['housemate', 'rating', 'raw_score', 'tweet_count'])
+        return df.sort_values('rating', ascending=False).reset_index(drop=True)
@@ -0,0 +1,200 @@
+"""Synthetic sample-tweet generation.
+
+Produces per-housemate CSVs in the same shape as the scraped data
+(date, tweet, urls), so the analysis pipeline can be exercised without
+hitting Twitter.
+"""
+
+import logging
+import os
+import random
+from datetime import datetime, timedelta
+from typing import ClassVar, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+HOUSEMATES = ['laycon', 'dorathy', 'ozo', 'trickytee', 'kiddwaya']
+
+BASE_DATE = datetime(2020, 9, 14)
+
+TWEETS_PER_HOUSEMATE = 40
+
+# Roughly how the default distribution splits when nothing is known
+# about a housemate. Built once at import, never per call.
+_DEFAULT_DISTRIBUTION = {'positive': 0.4, 'negative': 0.3, 'neutral': 0.3}
+
+
+class TweetTemplate:
+    """Canned tweet bodies with a {name} placeholder."""
+
+    POSITIVE_TEMPLATES = [
+        "{name} is playing the best game this season! #BBNaija",
+        "I love {name} so much, deserves to win #BBNaija",
+        "{name} was amazing in the task today #BBNaija",
+        "Team {name} all the way! Vote vote vote #BBNaija",
+        "{name} is such a genuine person, rooting for them #BBNaija",
+    ]
+
+    NEGATIVE_TEMPLATES = [
+        "{name} needs to leave the house already #BBNaija",
+        "I'm so tired of {name}'s drama this week #BBNaija",
+        "{name} was really out of line today #BBNaija",
+        "Can't believe {name} said that, so disappointing #BBNaija",
+    ]
+
+    NEUTRAL_TEMPLATES = [
+        "{name} is up for eviction this week #BBNaija",
+        "Watching {name} in the diary room now #BBNaija",
+        "{name} and the others are doing the task #BBNaija",
+        "Tonight's episode features {name} #BBNaija",
+    ]
+
+
+class SentimentDistributor:
+    """Per-housemate positive/negative/neutral tweet mix."""
+
+    # Built once at class creation; get_distribution is called inside the
+    # generation loop, so it must not rebuild this mapping per call.
+    _DISTRIBUTIONS: ClassVar[Dict[str, Dict[str, float]]] = {
+        'laycon': {'positive': 0.6, 'negative': 0.15, 'neutral': 0.25},
+        'dorathy': {'positive': 0.5, 'negative': 0.2, 'neutral': 0.3},
+        'ozo': {'positive': 0.45, 'negative': 0.25, 'neutral': 0.3},
+        'trickytee': {'positive': 0.35, 'negative': 0.3, 'neutral': 0.35},
+        'kiddwaya': {'positive': 0.4, 'negative': 0.3, 'neutral': 0.3},
+    }
+
+    @classmethod
+    def get_distribution(cls, housemate: str) -> Dict[str, float]:
+        return cls._DISTRIBUTIONS.get(housemate, _DEFAULT_DISTRIBUTION)
+
+
+class TweetGenerator:
+    """Generates single fake tweets for a housemate."""
+
+    TEMPLATES = {
+        'positive': TweetTemplate.POSITIVE_TEMPLATES,
+        'negative': TweetTemplate.NEGATIVE_TEMPLATES,
+        'neutral': TweetTemplate.NEUTRAL_TEMPLATES,
+    }
+
+    def generate_tweet(self, housemate: str,
+                       sentiment: str) -> Tuple[str, str, str]:
+        """Build one (date, tweet, urls) row."""
+        template = random.choice(self.TEMPLATES[sentiment])
+        text = template.format(name=housemate)
+        date = (BASE_DATE + timedelta(days=random.randint(0, 5),
+                                      hours=random.randint(0, 23)))
+        status_id = random.randint(10 ** 17, 10 ** 18)
+        urls = f"['https://twitter.com/bbnaija/status/{status_id}']"
+        return date.strftime('%Y-%m-%d %H:%M:%S'), text, urls
+
+    def generate_batch(self, housemate: str, sentiment: str, count: int,
+                       rng: np.random.Generator
+                       ) -> Tuple[List[str], List[str], List[str]]:
+        """Build ``count`` rows at once as three parallel lists.
+
+        All the randomness is drawn in four vectorized calls instead of
+        4 * count single-value ones, and the dates are computed with one
+        timedelta broadcast rather than per-row datetime arithmetic.
+        """
+        # Expand the {name} placeholder once per template rather than once
+        # per tweet — str.format re-parses the template on every call, and
+        # the housemate is fixed for the whole batch.
+        templates = [t.format(name=housemate)
+                     for t in self.TEMPLATES[sentiment]]
+        tpl_idx = rng.integers(0, len(templates), count)
+        days = rng.integers(0, 6, count)
+        hours = rng.integers(0, 24, count)
+        status_ids = rng.integers(10 ** 17, 10 ** 18, count)
+
+        dates = (pd.Timestamp(BASE_DATE)
+                 + pd.to_timedelta(days, 'D')
+                 + pd.to_timedelta(hours, 'h'))
+        date_strs = list(dates.strftime('%Y-%m-%d %H:%M:%S'))
+        texts = [templates[i] for i in tpl_idx]
+        urls = [f"['https://twitter.com/bbnaija/status/{i}']"
+                for i in status_ids]
+        return date_strs, texts, urls
+
+
+def _csv_field(value: str) -> str:
+    """Quote a field the way csv.writer would (minimal quoting)."""
+    if any(ch in value for ch in ',"\n\r'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+class CSVWriter:
+    """Writes generated tweet rows in the scraped-CSV schema."""
+
+    HEADER = ['date', 'tweet', 'urls']
+
+    # Linux caps an iovec at 1024 entries per writev call.
+    _IOV_MAX = 1024
+
+    def write_csv(self, filepath: str,
+                  tweets: List[Tuple[str, str, str]]) -> None:
+        """Emit the whole file with (nearly) one syscall.
+
+        Every row is pre-encoded to bytes and handed to os.writev as an
+        iovec, skipping both the csv module's per-row dispatch and the
+        buffered-IO layer. Platforms without writev get a single
+        os.write of the joined buffer instead.
+        """
+        lines = [(','.join(self.HEADER) + '\n').encode('utf-8')]
+        lines += [
+            f'{_csv_field(d)},{_csv_field(t)},{_csv_field(u)}\n'.encode(
+                'utf-8')
+            for d, t, u in tweets
+        ]
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, 'writev'):
+                for start in range(0, len(lines), self._IOV_MAX):
+                    os.writev(fd, lines[start:start + self._IOV_MAX])
+            else:
+                os.write(fd, b''.join(lines))
+        finally:
+            os.close(fd)
+        logger.info("Wrote %d sample tweets to %s", len(tweets), filepath)
+
+
+class SampleDataCoordinator:
+    """Drives generation of one sample CSV per housemate."""
+
+    def __init__(self, output_dir: str = 'Scraped_tweets',
+                 tweets_per_housemate: int = TWEETS_PER_HOUSEMATE,
+                 seed: int = None):
+        self.output_dir = output_dir
+        self.tweets_per_housemate = tweets_per_housemate
+        self.generator = TweetGenerator()
+        self.writer = CSVWriter()
+        self._rng = np.random.default_rng(seed)
+
+    def _generate_housemate_data(self, housemate: str) -> None:
+        distribution = SentimentDistributor.get_distribution(housemate)
+        dates: List[str] = []
+        texts: List[str] = []
+        urls: List[str] = []
+        for sentiment, share in distribution.items():
+            count = round(self.tweets_per_housemate * share)
+            d, t, u = self.generator.generate_batch(housemate, sentiment,
+                                                    count, self._rng)
+            dates += d
+            texts += t
+            urls += u
+        order = self._rng.permutation(len(dates))
+        tweets = [(dates[i], texts[i], urls[i]) for i in order]
+        self.writer.write_csv(f'{self.output_dir}/{housemate}.csv', tweets)
+
+    def generate_all_samples(self) -> None:
+        for housemate in HOUSEMATES:
+            self._generate_housemate_data(housemate)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    SampleDataCoordinator(seed=42).generate_all_samples()